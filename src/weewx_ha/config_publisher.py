@@ -4,7 +4,7 @@
 from collections import defaultdict
 import json
 import logging
-from typing import Any
+from typing import Any, Callable
 from zoneinfo import ZoneInfo
 
 # Third-Party Libraries
@@ -12,7 +12,29 @@ import paho.mqtt.client as mqtt
 from weewx.units import to_std_system  # type: ignore
 
 from .models import StationInfo
-from .utils import UnitSystem, get_key_config, get_unit_metadata
+from .utils import (
+    EMPTY_MAPPING,
+    UnitSystem,
+    get_key_config,
+    get_source_to_derived_dict,
+    get_unit_metadata,
+)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize an object to compact UTF-8 encoded JSON."""
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+_dumps: Callable[[Any], bytes] = _json_dumps
+try:
+    # Third-Party Libraries
+    import orjson  # type: ignore
+
+    _dumps = orjson.dumps
+except ImportError:
+    pass
+
 
 logger = logging.getLogger(__name__)
 
@@ -36,8 +58,25 @@ class ConfigPublisher:
         The unit system to use for measurements.
     seen_measurements : dict of str to dict of str to Any
         A dictionary to hold measurement metadata.
+    derived_by_source : dict of str to list of tuple of (str, dict of str to Any)
+        The seen derived sensors and their metadata, indexed by source key.
     """
 
+    __slots__ = (
+        "_base_payload_items",
+        "_unit_system_int",
+        "availability_topic",
+        "derived_by_source",
+        "device_description",
+        "discovery_topic_prefix",
+        "mqtt_client",
+        "node_id",
+        "seen_measurements",
+        "state_topic_prefix",
+        "time_zone",
+        "unit_system",
+    )
+
     def __init__(
         self,
         mqtt_client: mqtt.Client,
@@ -74,6 +113,10 @@ class ConfigPublisher:
         self.node_id: str = node_id
         self.state_topic_prefix: str = state_topic_prefix
         self.unit_system: UnitSystem = unit_system
+        # WeeWX unit system value packets are converted to, if any
+        self._unit_system_int: int | None = (
+            None if unit_system is None else int(unit_system)
+        )
 
         # Device metadata to include in discovery configurations
         self.device_description: dict[str, Any] = {
@@ -85,10 +128,20 @@ class ConfigPublisher:
             }
         }
 
+        # Payload items shared by the discovery configurations of all sensors,
+        # applied after the sensor metadata so that they always take precedence
+        self._base_payload_items: tuple[tuple[str, Any], ...] = tuple(
+            self.device_description.items()
+        )
+
         self.time_zone: ZoneInfo = station_info.time_zone
 
-        # Dictionary to hold measurement configuration and metadata
-        self.seen_measurements: dict[str, dict[str, Any]] = defaultdict(dict)
+        # Measurement configuration and metadata, only added once complete
+        self.seen_measurements: dict[str, dict[str, Any]] = {}
+        # Index of the seen derived sensors by the key they derive from
+        self.derived_by_source: dict[str, list[tuple[str, dict[str, Any]]]] = (
+            defaultdict(list)
+        )
 
     def process_packet(self, packet: dict) -> bool:
         """
@@ -107,21 +160,30 @@ class ConfigPublisher:
         """
         logger.debug("Processing packet")
         found_new_measurements = False
-        if self.unit_system is not None:
-            packet = to_std_system(packet, int(self.unit_system))
-        for key in packet.keys():
-            if key not in self.seen_measurements:
-                logger.debug(f"Discovered new measurement: {key}")
-                found_new_measurements = True
-                self.seen_measurements[key] |= get_key_config(key)
-                # Unit metadata is underlaid with the metadata from the key
-                self.seen_measurements[key]["metadata"] = get_unit_metadata(
-                    key, self.unit_system
-                ) | self.seen_measurements[key].get("metadata", {})
+        if self._unit_system_int is not None:
+            # Packets already in the target unit system are returned unchanged
+            packet = to_std_system(packet, self._unit_system_int)
+        # Only keys that have not been seen before need any further work
+        new_keys = [k for k in packet if k not in self.seen_measurements]
+        if not new_keys:
+            return False
+        for key in new_keys:
+            if key in self.seen_measurements:
+                # Already registered as a derived sensor of an earlier key
+                continue
+            logger.debug("Discovered new measurement: %s", key)
+            found_new_measurements = True
+            config = dict(get_key_config(key))
+            # Unit metadata is underlaid with the metadata from the key
+            config["metadata"] = {
+                **get_unit_metadata(key, self.unit_system),
+                **(config.get("metadata") or EMPTY_MAPPING),
+            }
+            self._register(key, config)
 
-                # Check if there are any derived sensors that use this key as source
-                if self._discover_derived_sensors(key):
-                    found_new_measurements = True
+            # Check if there are any derived sensors that use this key as source
+            if self._discover_derived_sensors(key):
+                found_new_measurements = True
 
         return found_new_measurements
 
@@ -138,44 +200,97 @@ class ConfigPublisher:
         bool
             True if new derived sensors were discovered, False otherwise
         """
-        from .utils import get_key_config_dict
-
         found_derived = False
-        logger.debug(f"Checking for derived sensors with source: {source_key}")
-        # Find all sensors that have this key as their source
-        # Create a snapshot of items to avoid issues if dictionary changes
-        for sensor_name, sensor_config in list(get_key_config_dict().items()):
-            if sensor_config.get("source") == source_key:
-                logger.debug(f"Found sensor {sensor_name} with source {source_key}")
-                if sensor_name not in self.seen_measurements:
-                    logger.info(
-                        f"Discovered derived measurement: {sensor_name} from source {source_key}"
-                    )
-                    self.seen_measurements[sensor_name] = get_key_config(
-                        sensor_name
-                    ).copy()
-                    # Derived sensors typically don't need unit metadata since they have custom conversion
-                    # But if they don't have unit_of_measurement explicitly set, use None
-                    if "unit_of_measurement" not in self.seen_measurements[
-                        sensor_name
-                    ].get("metadata", {}):
-                        self.seen_measurements[sensor_name].setdefault("metadata", {})[
-                            "unit_of_measurement"
-                        ] = None
-                    found_derived = True
-                else:
-                    logger.debug(
-                        f"Derived sensor {sensor_name} already in seen_measurements"
-                    )
+        logger.debug("Checking for derived sensors with source: %s", source_key)
+        # Find all sensors that have this key as their source and are not yet seen
+        candidates = get_source_to_derived_dict().get(source_key, ())
+        new_sensors = [s for s in candidates if s not in self.seen_measurements]
+        for sensor_name in new_sensors:
+            logger.info(
+                f"Discovered derived measurement: {sensor_name} from source {source_key}"
+            )
+            key_config = get_key_config(sensor_name)
+            # Derived sensors typically don't need unit metadata since they have custom conversion
+            # But if they don't have unit_of_measurement explicitly set, use None
+            metadata = dict(key_config.get("metadata") or EMPTY_MAPPING)
+            metadata.setdefault("unit_of_measurement", None)
+            config = {**key_config, "metadata": metadata}
+            self._register(sensor_name, config)
+            found_derived = True
 
         return found_derived
 
+    def _register(self, sensor_name: str, config: dict[str, Any]) -> None:
+        """Add a complete sensor configuration to the seen measurements.
+
+        Parameters
+        ----------
+        sensor_name : str
+            The name of the sensor.
+        config : dict of str to Any
+            The sensor's configuration entry.
+
+        Returns
+        -------
+        None
+        """
+        self._cache_discovery(sensor_name, config)
+        # Only publish the entry once it is complete
+        self.seen_measurements[sensor_name] = config
+        if source := config.get("source"):
+            self.derived_by_source[source].append((sensor_name, config))
+
+    def _cache_discovery(self, sensor_name: str, config: dict[str, Any]) -> None:
+        """Compose and cache the topics and discovery payload for a sensor.
+
+        The discovery topic and serialized payload are stored in the sensor's
+        configuration entry so that publishing discovery configurations does
+        not need to rebuild them.
+
+        Parameters
+        ----------
+        sensor_name : str
+            The name of the sensor.
+        config : dict of str to Any
+            The sensor's configuration entry, updated in place.
+
+        Returns
+        -------
+        None
+        """
+        # Construct state topic
+        state_topic = f"{self.state_topic_prefix}/{sensor_name}"
+        # Resolve the integration once and record it in the entry
+        integration = config.setdefault("integration", "sensor")
+        # Construct discovery topic
+        discovery_topic = f"{self.discovery_topic_prefix}/{integration}/{self.node_id}/{sensor_name}/config"
+        # Construct the configuration payload
+        payload: dict[str, Any] = {
+            "availability_topic": self.availability_topic,
+            "state_topic": state_topic,
+            "unique_id": f"{self.node_id}_{sensor_name}",
+        }
+        # Skip any metadata with None values
+        payload.update(
+            (k, v)
+            for k, v in (config.get("metadata") or EMPTY_MAPPING).items()
+            if v is not None
+        )
+        payload.update(self._base_payload_items)
+
+        logger.debug(
+            "Composed discovery configuration: %s: %s", discovery_topic, payload
+        )
+        config["_discovery_topic"] = discovery_topic
+        config["_discovery_payload"] = _dumps(payload)
+
     def publish_discovery(self) -> None:
         """Publish discovery configurations for Home Assistant.
 
         This method publishes MQTT discovery configurations for each sensor
         in previously seen measurements to allow Home Assistant to automatically
-        discover and configure the sensors.
+        discover and configure the sensors.  The topics and payloads are
+        composed once when a sensor is first seen.
 
         Parameters
         ----------
@@ -188,26 +303,10 @@ class ConfigPublisher:
         logger.info(
             f"Publishing {len(self.seen_measurements)} discovery configurations"
         )
-        for sensor_name, config in self.seen_measurements.items():
-            # Construct discovery topic
-            integration = config.get("integration", "sensor")
-            discovery_topic = f"{self.discovery_topic_prefix}/{integration}/{self.node_id}/{sensor_name}/config"
-            # Construct the configuration payload
-            payload: dict[str, Any] = (
-                {
-                    "availability_topic": self.availability_topic,
-                    "state_topic": f"{self.state_topic_prefix}/{sensor_name}",
-                    "unique_id": f"{self.node_id}_{sensor_name}",
-                }
-                | config.get("metadata", {})
-                | self.device_description
-            )
-
-            # Remove any keys with None values
-            payload = {k: v for k, v in payload.items() if v is not None}
-
-            logger.debug(
-                f"Publishing discovery configuration: {discovery_topic}: {payload}"
-            )
+        # The publishes are queued by the client's network loop thread, which
+        # keeps running during the burst so keep-alives are not delayed
+        publish = self.mqtt_client.publish
+        # Create a snapshot of values to avoid issues if dictionary changes
+        for config in list(self.seen_measurements.values()):
             # Publish the discovery configuration
-            self.mqtt_client.publish(discovery_topic, json.dumps(payload))
+            publish(config["_discovery_topic"], config["_discovery_payload"])
@@ -7,9 +7,11 @@ configuration data, and handles WeeWX loop packets.
 """
 
 # Standard Python Libraries
-from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 import logging
-from typing import Any
+import queue
+import threading
+from typing import Any, Callable
 
 # Third-Party Libraries
 import paho.mqtt.client as mqtt
@@ -19,6 +21,7 @@ from weewx.engine import StdEngine, StdService  # type: ignore
 from . import ConfigPublisher, PacketPreprocessor, StatePublisher
 from .locale_loader import set_config_overrides, set_language
 from .models import ExtensionConfig, MQTTConfig
+from .utils import reset_caches
 
 logger = logging.getLogger(__name__)
 
@@ -26,7 +29,6 @@ logger = logging.getLogger(__name__)
 
 # Constants
 EXTENSION_CONFIG_KEY = "HomeAssistant"
-THREAD_POOL_SIZE = 2
 
 
 class Controller(StdService):
@@ -53,9 +55,11 @@ class Controller(StdService):
                 exc_info=True,
             )
             return
-        logger.debug(
-            f"Loaded extension configuration:\n{self.config.model_dump_json(indent=4)}"
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Loaded extension configuration:\n%s",
+                self.config.model_dump_json(indent=4),
+            )
 
         # Set language for localized YAML loading
         set_language(self.config.lang)
@@ -69,13 +73,16 @@ class Controller(StdService):
         if self.config.enums:
             overrides["enums"] = self.config.enums
         set_config_overrides(overrides if overrides else None)
+        # Drop configuration loaded with the settings of a previous instance
+        reset_caches()
+
+        # Queue of tasks processed in FIFO order by a single worker thread.
+        # Created before the MQTT client so its callbacks can enqueue tasks.
+        self._worker_queue: queue.Queue[Callable[[], Any] | None] = queue.Queue()
 
         self.availability_topic: str = f"{self.config.state_topic_prefix}/status"
         self.mqtt_client: mqtt.Client = self.init_mqtt_client(self.config.mqtt)
 
-        # Thread pool for managing tasks
-        self.executor = ThreadPoolExecutor(max_workers=THREAD_POOL_SIZE)
-
         # Create packet preprocessor
         self.packet_preprocessor = PacketPreprocessor()
 
@@ -97,6 +104,12 @@ class Controller(StdService):
             self.config.unit_system,
         )
 
+        # Start the worker once everything it uses has been created
+        self._worker_thread = threading.Thread(
+            target=self._drain, name="weewx-ha-worker", daemon=True
+        )
+        self._worker_thread.start()
+
         # Register the callbacks for loop packets and archive records
         self.bind(NEW_LOOP_PACKET, self.on_weewx_loop)
         self.bind(NEW_ARCHIVE_RECORD, self.on_weewx_archive)
@@ -161,8 +174,7 @@ class Controller(StdService):
             msg.topic == f"{self.config.discovery_topic_prefix}/status"
             and msg.payload == b"online"
         ):
-            future = self.executor.submit(self.config_publisher.publish_discovery)
-            future.add_done_callback(self.check_future_errors)
+            self._worker_queue.put(self._publish_discovery)
 
     def on_mqtt_subscribe(
         self, client: mqtt.Client, userdata, mid, reason_code_list, properties
@@ -176,63 +188,54 @@ class Controller(StdService):
         """Handle callback for when the broker responds to an unsubscribe request."""
         logger.info(f"Unsubscribed from topic, message ID: {mid}")
 
-    def check_future_errors(self, future):
-        """Handle callback and check for exceptions in a Future."""
-        try:
-            future.result()
-        except Exception as e:
-            logger.error(f"Error in future: {e}", exc_info=True)
+    def _drain(self) -> None:
+        """Run queued tasks in order until the shutdown sentinel is received."""
+        while (task := self._worker_queue.get()) is not None:
+            try:
+                task()
+            except Exception as e:
+                logger.error(f"Error in worker task: {e}", exc_info=True)
 
-    def check_config_update(self, future):
-        """Check if a config update is needed after processing a loop packet."""
-        try:
-            # Get the result of the Future, which will be True or False
-            needs_publish: bool = future.result()
-        except Exception as e:
-            logger.error(f"Error while checking config update: {e}", exc_info=True)
-            return
-        if needs_publish:
-            logger.debug("New measurements found, submitting config update task")
-            future2 = self.executor.submit(self.config_publisher.publish_discovery)
-            future2.add_done_callback(self.check_future_errors)
+    def _publish_discovery(self) -> None:
+        """Publish all discovery configurations."""
+        self.config_publisher.publish_discovery()
 
-    def preprocessor_complete(self, future):
-        """Handle callback for when the preprocessor task is complete."""
-        try:
-            packet: dict = future.result()
-        except Exception as e:
-            logger.error(f"Error while pre-processing packet: {e}", exc_info=True)
-            return
-        state_future = self.executor.submit(self.state_publisher.process_packet, packet)
-        # Add callback to state publishing task
-        state_future.add_done_callback(self.check_future_errors)
-        config_future = self.executor.submit(
-            self.config_publisher.process_packet, packet
-        )
-        # Add callbacks to config processing task
-        config_future.add_done_callback(self.check_config_update)
+    def _pipeline(self, packet: dict) -> None:
+        """Pre-process a packet, update configurations, and publish its state.
+
+        All stages run sequentially within a single worker task.  New
+        configurations are published before the state so that Home Assistant
+        knows about new sensors when their first values arrive.
+        """
+        packet = self.packet_preprocessor.process_packet(packet)
+        if self.config_publisher.process_packet(packet):
+            logger.debug("New measurements found, publishing config update")
+            self.config_publisher.publish_discovery()
+        self.state_publisher.process_packet(packet)
 
     def on_weewx_loop(self, event):
         """Handle callback for WeeWX loop packets."""
-        packet_keys = sorted(event.packet.keys())
-        logger.debug(f"Received WeeWX loop packet with keys: {packet_keys}")
-        if self.mqtt_client.is_connected():
-            preprocessor_future = self.executor.submit(
-                self.packet_preprocessor.process_packet, event.packet.copy()
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Received WeeWX loop packet with keys: %s", sorted(event.packet.keys())
             )
-            preprocessor_future.add_done_callback(self.preprocessor_complete)
+        if self.mqtt_client.is_connected():
+            # WeeWX and later services keep using the packet, so the worker
+            # gets a snapshot rather than the live dictionary
+            self._worker_queue.put(partial(self._pipeline, dict(event.packet)))
         else:
             logger.warning("MQTT client is not connected, skipping packet processing")
 
     def on_weewx_archive(self, event):
         """Handle callback for WeeWX archive records."""
-        record_keys = sorted(event.record.keys())
-        logger.debug(f"Received WeeWX archive record with keys: {record_keys}")
-        if self.mqtt_client.is_connected():
-            preprocessor_future = self.executor.submit(
-                self.packet_preprocessor.process_packet, event.record.copy()
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Received WeeWX archive record with keys: %s",
+                sorted(event.record.keys()),
             )
-            preprocessor_future.add_done_callback(self.preprocessor_complete)
+        if self.mqtt_client.is_connected():
+            # Snapshot the record for the worker, as for loop packets
+            self._worker_queue.put(partial(self._pipeline, dict(event.record)))
         else:
             logger.warning(
                 "MQTT client is not connected, skipping archive record processing"
@@ -254,7 +257,8 @@ class Controller(StdService):
             logger.info("Offline availability publication complete")
         except Exception as e:
             logger.error(f"Error while publishing offline availability: {e}")
-        # Shutdown the executor, allowing threads to complete pending work
-        self.executor.shutdown(wait=True)
+        # Stop the worker, allowing it to complete pending work
+        self._worker_queue.put(None)
+        self._worker_thread.join()
         self.mqtt_client.disconnect()  # Also stops the MQTT client loop
         logger.info("All publisher tasks shut down gracefully.")
@@ -1,14 +1,21 @@
 """Loader for localized configuration from YAML files."""
 
 # Standard Python Libraries
-from copy import deepcopy
+from collections import OrderedDict
+from functools import lru_cache
+import hashlib
 import logging
+import marshal
+import os
 from pathlib import Path
 from typing import Any
 
 # Third-Party Libraries
 import yaml  # type: ignore[import-untyped]
 
+# Use the libyaml based loader when PyYAML was built with it
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 logger = logging.getLogger(__name__)
 
 # Global language setting (can be set from configuration)
@@ -17,10 +24,152 @@ _current_language: str | None = None
 # Global config overrides (can be set from configuration)
 _config_overrides: dict[str, Any] | None = None
 
+# Incremented whenever the language or config overrides change so that cached
+# results of earlier settings are never returned
+_settings_version: int = 0
+
+# Parsed YAML files keyed by path, validated against the file's mtime and size
+_YAML_CACHE: OrderedDict[Path, tuple[float, int, dict[str, Any]]] = OrderedDict()
+_YAML_CACHE_SIZE = 32
+
+# Directory for parsed YAML files that persist across process restarts, or
+# None to use the user's cache directory.  Data is stored with marshal, which
+# is not secure against maliciously constructed data.  The cache is trusted
+# only because it lives in a directory that only the same user can write to.
+_DISK_CACHE_DIR: Path | None = None
+
+# Directory of the bundled locale files
+_LOCALES_DIR: Path = Path(__file__).parent / "locales"
+
+
+@lru_cache(maxsize=1)
+def _user_cache_dir() -> Path | None:
+    """Return the user's cache directory, or None if it cannot be determined.
+
+    This is resolved on first use rather than at import time, as a WeeWX daemon
+    may run without a home directory.
+    """
+    try:
+        cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    except (RuntimeError, KeyError):
+        logger.debug("No home directory, parsed configuration is not cached on disk")
+        return None
+    return Path(cache_home) / "weewx_ha"
+
+
+def _disk_cache_path(path: Path) -> Path | None:
+    """Return the disk cache file for a YAML file, or None if disabled."""
+    cache_dir = _DISK_CACHE_DIR or _user_cache_dir()
+    if cache_dir is None:
+        return None
+    digest = hashlib.sha256(str(path.resolve()).encode()).hexdigest()[:16]
+    return cache_dir / f"{path.stem}-{digest}.marshal"
+
+
+def _read_disk_cache(path: Path, st: os.stat_result) -> dict[str, Any] | None:
+    """Read parsed YAML data from the disk cache if it matches the file."""
+    cache_path = _disk_cache_path(path)
+    if cache_path is None:
+        return None
+    try:
+        # Trusted as only the user loading it can write to the cache directory
+        cached = marshal.loads(cache_path.read_bytes())  # nosec B302
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if not (
+        isinstance(cached, tuple) and len(cached) == 3 and isinstance(cached[2], dict)
+    ):
+        logger.debug(f"Ignoring malformed configuration cache {cache_path}")
+        return None
+    mtime_ns, size, data = cached
+    if (mtime_ns, size) != (st.st_mtime_ns, st.st_size):
+        return None
+    logger.debug(f"Loaded cached configuration for {path} from {cache_path}")
+    return data
+
+
+def _write_disk_cache(path: Path, st: os.stat_result, data: dict[str, Any]) -> None:
+    """Write parsed YAML data to the disk cache, ignoring any failures."""
+    cache_path = _disk_cache_path(path)
+    if cache_path is None:
+        return
+    try:
+        cache_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_bytes(marshal.dumps((st.st_mtime_ns, st.st_size, data)))
+        os.replace(tmp_path, cache_path)
+    except (OSError, ValueError) as e:
+        logger.debug(f"Could not write configuration cache {cache_path}: {e}")
+
+
+def _parse_yaml_file(path: Path) -> dict[str, Any]:
+    """Parse a YAML file, reusing the previous result if the file is unchanged.
+
+    Parameters
+    ----------
+    path : Path
+        Path of the YAML file to parse
+
+    Returns
+    -------
+    dict[str, Any]
+        Parsed YAML data, shared between callers and must not be modified
+
+    Raises
+    ------
+    FileNotFoundError
+        If the file does not exist
+    yaml.YAMLError
+        If the file cannot be parsed
+
+    """
+    st = path.stat()
+    cached = _YAML_CACHE.get(path)
+    if cached is not None and cached[:2] == (st.st_mtime, st.st_size):
+        _YAML_CACHE.move_to_end(path)
+        return cached[2]
+
+    data = _read_disk_cache(path, st)
+    if data is None:
+        data = yaml.load(path.read_bytes(), Loader=_SafeLoader) or {}  # nosec B506
+        _write_disk_cache(path, st, data)
+    _YAML_CACHE[path] = (st.st_mtime, st.st_size, data)
+    _YAML_CACHE.move_to_end(path)
+    if len(_YAML_CACHE) > _YAML_CACHE_SIZE:
+        _YAML_CACHE.popitem(last=False)
+    return data
+
+
+def precompile_locales() -> int:
+    """Parse all bundled locale files into the disk cache.
+
+    Intended to be run once after installation or upgrade so that the first
+    start of WeeWX does not have to parse any YAML.
+
+    Returns
+    -------
+    int
+        Number of locale files parsed
+
+    """
+    count = 0
+    for path in sorted(_LOCALES_DIR.glob("*.yaml")):
+        try:
+            _parse_yaml_file(path)
+        except yaml.YAMLError as e:
+            logger.error(f"Error parsing YAML file {path}: {e}")
+            continue
+        count += 1
+    return count
+
 
 def _deep_merge(base: dict, overlay: dict) -> dict:
     """Deep merge two dictionaries, with overlay taking precedence.
 
+    Only the dictionaries along the merged paths are copied; all other values
+    are shared with the inputs.  The returned dictionary must therefore be
+    treated as read-only.
+
     Parameters
     ----------
     base : dict
@@ -34,19 +183,31 @@ def _deep_merge(base: dict, overlay: dict) -> dict:
         Merged dictionary with overlay values taking precedence
 
     """
-    result = deepcopy(base)
+    if not overlay:
+        # Nothing to merge, share the base dictionary itself
+        return base
+
+    result = dict(base)
 
     for key, value in overlay.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
+        if isinstance(value, dict) and isinstance(existing := result.get(key), dict):
             # Recursively merge nested dictionaries
-            result[key] = _deep_merge(result[key], value)
+            result[key] = _deep_merge(existing, value)
         else:
             # Use overlay value
-            result[key] = deepcopy(value)
+            result[key] = value
 
     return result
 
 
+def _invalidate_caches() -> None:
+    """Invalidate cached results of the load functions."""
+    global _settings_version
+    _settings_version += 1
+    _load_yaml_cached.cache_clear()
+    _load_sensors_cached.cache_clear()
+
+
 def set_language(language: str | None) -> None:
     """Set the current language for loading localized YAML files.
 
@@ -58,6 +219,7 @@ def set_language(language: str | None) -> None:
     """
     global _current_language
     _current_language = language
+    _invalidate_caches()
     logger.info(f"Language set to: {language or 'default (fallback)'}")
 
 
@@ -84,6 +246,7 @@ def set_config_overrides(overrides: dict[str, Any] | None) -> None:
     """
     global _config_overrides
     _config_overrides = overrides
+    _invalidate_caches()
     logger.info(
         f"Config overrides set: {list(overrides.keys()) if overrides else 'None'}"
     )
@@ -124,20 +287,35 @@ def load_yaml(base_filename: str, language: str | None = None) -> dict[str, Any]
     dict[str, Any]
         Loaded configuration dictionary (merged if localized file exists)
 
-    """
-    locales_dir = Path(__file__).parent / "locales"
+    Notes
+    -----
+    Results are cached until the language or config overrides change and are
+    shared between callers, so they must be treated as read-only.
 
+    """
     # Use provided language or global setting
-    lang = language or _current_language
+    return _load_yaml_cached(
+        base_filename, language or _current_language, _settings_version
+    )
+
+
+@lru_cache(maxsize=32)
+def _load_yaml_cached(
+    base_filename: str, lang: str | None, settings_version: int
+) -> dict[str, Any]:
+    """Load and merge a YAML configuration file (see load_yaml).
+
+    The settings version is only used as part of the cache key.
+    """
+    locales_dir = _LOCALES_DIR
 
     # Always load base file as fallback
     base_file_path = locales_dir / base_filename
     base_data: dict[str, Any] = {}
 
     try:
-        with open(base_file_path, encoding="utf-8") as f:
-            base_data = yaml.safe_load(f) or {}
-            logger.debug(f"Loaded base configuration from {base_file_path}")
+        base_data = _parse_yaml_file(base_file_path)
+        logger.debug(f"Loaded base configuration from {base_file_path}")
     except FileNotFoundError:
         logger.error(f"Base configuration file not found: {base_file_path}")
         return {}
@@ -157,14 +335,13 @@ def load_yaml(base_filename: str, language: str | None = None) -> dict[str, Any]
             localized_file_path = locales_dir / localized_filename
 
             try:
-                with open(localized_file_path, encoding="utf-8") as f:
-                    localized_data = yaml.safe_load(f) or {}
-                    logger.info(
-                        f"Loaded localized configuration from {localized_file_path}, "
-                        f"merging with base"
-                    )
-                    # Deep merge: base data with localized overlay
-                    result = _deep_merge(result, localized_data)
+                localized_data = _parse_yaml_file(localized_file_path)
+                logger.info(
+                    f"Loaded localized configuration from {localized_file_path}, "
+                    f"merging with base"
+                )
+                # Deep merge: base data with localized overlay
+                result = _deep_merge(result, localized_data)
             except FileNotFoundError:
                 logger.debug(
                     f"Localized file not found: {localized_file_path}, using base only"
@@ -236,25 +413,57 @@ def load_sensors(language: str | None = None) -> dict[str, Any]:
     dict[str, Any]
         Dictionary of sensor configurations
 
+    """
+    return _load_sensors_cached(language or _current_language, _settings_version)
+
+
+@lru_cache(maxsize=8)
+def _load_sensors_cached(language: str | None, settings_version: int) -> dict[str, Any]:
+    """Load sensor configurations and resolve enum references (see load_sensors).
+
+    The settings version is only used as part of the cache key.
     """
     data = load_yaml("sensors.yaml", language)
 
     # Process special markers like @cardinal_directions
     enums = load_enums(language)
-
-    def process_value(value: Any) -> Any:
-        """Recursively process values to resolve enum references."""
-        if isinstance(value, str) and value.startswith("@"):
-            # Reference to enum mapping
-            enum_name = value[1:]  # Remove @ prefix
-            if enum_name in enums:
-                return list(enums[enum_name].values())
+    # Materialize each enum's values once; every reference shares the tuple
+    resolved_enums = {name: tuple(values.values()) for name, values in enums.items()}
+
+    # Collect the paths of all enum references; only containers are pushed on
+    # the stack, other leaves are skipped as soon as they are seen
+    references: list[tuple[tuple[Any, ...], str]] = []
+    stack: list[tuple[tuple[Any, ...], Any]] = [((), data)]
+    while stack:
+        path, node = stack.pop()
+        items = node.items() if isinstance(node, dict) else enumerate(node)
+        for key, value in items:
+            if isinstance(value, (dict, list)):
+                stack.append((path + (key,), value))
+            elif isinstance(value, str) and value.startswith("@"):
+                references.append((path + (key,), value))
+
+    # Containers are shared with the loaded data and only copied along the
+    # paths to resolved references, tracked by the ids of the copies
+    result: dict[str, Any] = data
+    copied: set[int] = set()
+    for path, value in references:
+        # Reference to enum mapping
+        enum_name = value[1:]  # Remove @ prefix
+        if enum_name not in resolved_enums:
             logger.warning(f"Unknown enum reference: {value}")
-            return value
-        elif isinstance(value, dict):
-            return {k: process_value(v) for k, v in value.items()}
-        elif isinstance(value, list):
-            return [process_value(v) for v in value]
-        return value
-
-    return {key: process_value(config) for key, config in data.items()}
+            continue
+        if id(result) not in copied:
+            result = dict(result)
+            copied.add(id(result))
+        container: Any = result
+        for step in path[:-1]:
+            child = container[step]
+            if id(child) not in copied:
+                child = dict(child) if isinstance(child, dict) else list(child)
+                copied.add(id(child))
+                container[step] = child
+            container = child
+        container[path[-1]] = resolved_enums[enum_name]
+
+    return result
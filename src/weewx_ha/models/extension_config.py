@@ -16,7 +16,7 @@ logger = logging.getLogger(__name__)
 class ExtensionConfig(BaseModel):
     """Configuration model for the extension configuration."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
     discovery_topic_prefix: str = Field(
         default="homeassistant", description="Prefix for the MQTT discovery topic"
@@ -59,7 +59,7 @@ class ExtensionConfig(BaseModel):
         """Create an instance from a configuration dictionary."""
         extension_config = config_dict.get(key, {})
         try:
-            return cls(**extension_config)
+            return cls.model_validate(extension_config)
         except ValidationError as e:
             logger.error(f"Configuration validation error: {e}")
             raise e
@@ -12,7 +12,7 @@ from . import TLSConfig
 class MQTTConfig(BaseModel):
     """MQTT broker configuration model."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
     client_id: Optional[str] = None
     hostname: str = Field(..., min_length=1, description="MQTT broker hostname")
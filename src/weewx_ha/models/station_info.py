@@ -10,10 +10,14 @@ from pydantic import BaseModel, ConfigDict, Field, field_validator
 logger = logging.getLogger(__name__)
 
 
+# Default time zone shared by every station without a configured time zone
+_UTC: ZoneInfo = ZoneInfo("UTC")
+
+
 class StationInfo(BaseModel):
     """Model for describing a weather station device."""
 
-    model_config = ConfigDict(extra="forbid", populate_by_name=True)
+    model_config = ConfigDict(extra="forbid", frozen=True, populate_by_name=True)
 
     name: str = Field(..., description="Name of the weather station.", min_length=1)
     model: str = Field(..., description="Model of the weather station.", min_length=1)
@@ -21,7 +25,7 @@ class StationInfo(BaseModel):
         ..., description="Manufacturer of the weather station.", min_length=1
     )
     time_zone: ZoneInfo = Field(
-        default_factory=lambda: ZoneInfo("UTC"),
+        default_factory=lambda: _UTC,
         description="Time zone of the weather station.",
         alias="timezone",
     )
@@ -14,7 +14,7 @@ logger = logging.getLogger(__name__)
 class TLSConfig(BaseModel):
     """Pydantic model for secure MQTT TLS configuration defaults."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
     cadata: Optional[str] = Field(
         None, description="String containing trusted CA certificates."
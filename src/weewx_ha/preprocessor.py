@@ -20,18 +20,23 @@ TX_BATTERY_STATUS_FIELDS = [
 class PacketPreprocessor:
     """Pre-process loop packets."""
 
+    __slots__ = ()
+
     def __init__(self):
         """Initialize the pre-processor."""
         pass
 
     def process_packet(self, packet: dict) -> dict:
-        """Modify the packet before it is processed."""
+        """Modify the packet before it is processed.
+
+        The packet is modified in place, the controller hands over its own
+        snapshot of each WeeWX packet.
+        """
         logger.debug("Pre-processing packet")
         if "txBatteryStatus" in packet:
             logger.debug("Processing txBatteryStatus")
-            txBatteryStatus = packet["txBatteryStatus"]
+            txBatteryStatus = packet.pop("txBatteryStatus")
             # txBatteryStatus is a bitmap.  Break bits into individual fields.
             for i, field in enumerate(TX_BATTERY_STATUS_FIELDS):
                 packet[field] = txBatteryStatus & (1 << i)
-            del packet["txBatteryStatus"]
         return packet
@@ -5,7 +5,7 @@ import logging
 
 # Third-Party Libraries
 import paho.mqtt.client as mqtt
-from weewx.units import to_std_system
+from weewx.units import to_std_system  # type: ignore
 
 from . import ConfigPublisher, UnitSystem
 
@@ -31,6 +31,16 @@ class StatePublisher:
         The unit system to use for the state updates.
     """
 
+    __slots__ = (
+        "_state_topics",
+        "_unit_system_int",
+        "config_publisher",
+        "mqtt_client",
+        "settled_countdown",
+        "state_topic_prefix",
+        "unit_system",
+    )
+
     def __init__(
         self,
         mqtt_client: mqtt.Client,
@@ -55,7 +65,13 @@ class StatePublisher:
         self.mqtt_client = mqtt_client
         self.config_publisher = config_publisher
         self.state_topic_prefix = state_topic_prefix
+        # State topics of the published keys, composed once per key
+        self._state_topics: dict[str, str] = {}
         self.unit_system = unit_system
+        # WeeWX unit system value packets are converted to, if any
+        self._unit_system_int: int | None = (
+            None if unit_system is None else int(unit_system)
+        )
         self.settled_countdown = SETTLE_COUNTDOWN_START
 
     def process_packet(self, packet: dict) -> None:
@@ -64,13 +80,19 @@ class StatePublisher:
         if self.settled_countdown > 0:
             # Wait for the system to settle before emitting warnings for missing configurations
             self.settled_countdown -= 1
-        if self.unit_system is not None:
-            packet = to_std_system(packet, int(self.unit_system))
+        if self._unit_system_int is not None:
+            # Packets already in the target unit system are returned unchanged
+            packet = to_std_system(packet, self._unit_system_int)
+        # Bind attributes used for every key to locals
+        config_publisher = self.config_publisher
+        seen_measurements = config_publisher.seen_measurements
+        derived_by_source = config_publisher.derived_by_source
+        publish = self.mqtt_client.publish
         for key, value in packet.items():
             if value is None:
                 # Publishing None values causes Home Assistant templates to fail
                 continue
-            config = self.config_publisher.seen_measurements.get(key)
+            config = seen_measurements.get(key)
             if config is None:
                 # Skip if the configuration is not found in the seen measurements
                 if self.settled_countdown == 0:
@@ -83,11 +105,21 @@ class StatePublisher:
 
             if convert_lambda := config.get("convert_lambda"):
                 # Apply conversion lambda if it exists
-                value = convert_lambda(value, self.config_publisher)
-            self.mqtt_client.publish(f"{self.state_topic_prefix}/{key}", value)
+                value = convert_lambda(value, config_publisher)
+            publish(self._state_topic(key), value)
 
             # Publish derived sensors that use this key as source (use original value)
-            self._publish_derived_sensors(key, original_value)
+            if key in derived_by_source:
+                self._publish_derived_sensors(key, original_value)
+
+    def _state_topic(self, sensor_name: str) -> str:
+        """Return the state topic of a sensor, composing it on first use."""
+        topic = self._state_topics.get(sensor_name)
+        if topic is None:
+            topic = self._state_topics[sensor_name] = (
+                f"{self.state_topic_prefix}/{sensor_name}"
+            )
+        return topic
 
     def _publish_derived_sensors(self, source_key: str, source_value: float) -> None:
         """Publish derived sensors that use the source key as their data source.
@@ -103,26 +135,25 @@ class StatePublisher:
         -------
         None
         """
-        # Find all sensors in seen_measurements that have this source_key
-        # Create a snapshot of items to avoid RuntimeError if dictionary changes during iteration
-        derived_count = 0
-        for sensor_name, sensor_config in list(
-            self.config_publisher.seen_measurements.items()
-        ):
-            if sensor_config.get("source") == source_key:
-                derived_count += 1
-                if convert_lambda := sensor_config.get("convert_lambda"):
-                    derived_value = convert_lambda(source_value, self.config_publisher)
-                    self.mqtt_client.publish(
-                        f"{self.state_topic_prefix}/{sensor_name}", derived_value
-                    )
-                    logger.debug(
-                        f"Published derived sensor {sensor_name} from {source_key}: {derived_value}"
-                    )
-                else:
-                    logger.warning(
-                        f"Derived sensor {sensor_name} has source {source_key} but no convert_lambda"
-                    )
+        # Find all seen sensors that have this source_key
+        derived_sensors = self.config_publisher.derived_by_source.get(source_key, ())
+        derived_count = len(derived_sensors)
+        for sensor_name, sensor_config in derived_sensors:
+            if convert_lambda := sensor_config.get("convert_lambda"):
+                derived_value = convert_lambda(source_value, self.config_publisher)
+                self.mqtt_client.publish(self._state_topic(sensor_name), derived_value)
+                logger.debug(
+                    "Published derived sensor %s from %s: %s",
+                    sensor_name,
+                    source_key,
+                    derived_value,
+                )
+            else:
+                logger.warning(
+                    f"Derived sensor {sensor_name} has source {source_key} but no convert_lambda"
+                )
 
         if derived_count > 0:
-            logger.debug(f"Published {derived_count} derived sensors from {source_key}")
+            logger.debug(
+                "Published %d derived sensors from %s", derived_count, source_key
+            )
@@ -1,12 +1,15 @@
 """Utility functions and data."""
 
 # Standard Python Libraries
-from copy import deepcopy
+from collections import defaultdict
 from datetime import datetime, timezone
 from enum import Enum
+from functools import lru_cache
 import logging
-import re
-from typing import Any
+import string
+import sys
+from types import MappingProxyType
+from typing import Any, Callable, Final, Mapping
 
 # Third-Party Libraries
 import weewx  # type: ignore
@@ -16,50 +19,129 @@ from .locale_loader import load_enums, load_sensors, load_units
 
 logger = logging.getLogger(__name__)
 
+# Expansions of abbreviated first words of generated names
+_NAME_PREFIXES: Final[Mapping[str, str]] = MappingProxyType(
+    {"In": "Indoor", "Out": "Outdoor", "Tx": "Transmit", "Rx": "Receive"}
+)
+
+# Keywords of generated names and the keys whose configuration they reuse, in
+# order of precedence
+_GUESS_TEMPLATES: Final[tuple[tuple[str, str], ...]] = (
+    ("alarm", "extraAlarm"),
+    ("humidity", "outHumidity"),
+    ("pressure", "pressure"),
+    ("temperature", "outTemp"),
+)
+
+# Shared read-only empty mapping used as a default to avoid allocating new dicts
+EMPTY_MAPPING: Final[Mapping[str, Any]] = MappingProxyType({})
+
 # Global caches for lazy-loaded configuration
-_ENUM_MAPS: dict[str, dict[int, str]] | None = None
-_UNIT_METADATA: dict[str, dict[str, Any]] | None = None
-_SENSORS_YAML: dict[str, Any] | None = None
+# The loaded tables are read-only as they are shared by all callers
+_ENUM_MAPS: Mapping[str, Mapping[int, str]] | None = None
+_UNIT_METADATA: Mapping[str, Mapping[str, Any]] | None = None
+_SENSORS_YAML: Mapping[str, Any] | None = None
+
+# Enum tables bound directly for the conversion functions, set with _ENUM_MAPS
+_BEAUFORT_SCALE: Mapping[int, str] = MappingProxyType({})
+_CARDINAL_DIRECTIONS: tuple[str, ...] | None = None
+
+# Unit metadata of the unit system itself, which has no unit
+_USUNITS_METADATA: Final[Mapping[str, Any]] = MappingProxyType(
+    {"unit_of_measurement": None}
+)
+
+# Reciprocal of the 22.5 degrees covered by each cardinal direction
+_CARDINAL_SECTOR_SCALE: Final[float] = 1 / 22.5
+
+
+def _freeze(table: Mapping[Any, Any]) -> Mapping[Any, Any]:
+    """Return a read-only view of a loaded table and its entries.
+
+    Nested values are left as plain data, as they end up in discovery payloads
+    and the JSON encoders cannot serialize mapping proxies.  Entry strings are
+    interned, so repeated values such as the value templates of units with the
+    same rounding share one object.
+    """
+    return MappingProxyType(
+        {
+            name: (
+                MappingProxyType(
+                    {
+                        key: sys.intern(value) if type(value) is str else value
+                        for key, value in entry.items()
+                    }
+                )
+                if isinstance(entry, dict)
+                else entry
+            )
+            for name, entry in table.items()
+        }
+    )
 
 
 def _ensure_loaded() -> None:
     """Ensure configuration is loaded (lazy loading after language is set)."""
     global _ENUM_MAPS, _UNIT_METADATA, _SENSORS_YAML
+    global _BEAUFORT_SCALE, _CARDINAL_DIRECTIONS
     if _ENUM_MAPS is None:
-        _ENUM_MAPS = load_enums()
+        enum_maps = _freeze(load_enums())
+        # The enums file may be missing or incomplete, in which case the
+        # conversions fall back to unlocalized values
+        beaufort_scale: Mapping[int, str] = enum_maps.get("beaufort_scale", {})
+        if not isinstance(beaufort_scale, Mapping):
+            beaufort_scale = MappingProxyType({})
+        cardinal_directions = enum_maps.get("cardinal_directions")
+        if isinstance(cardinal_directions, Mapping) and all(
+            i in cardinal_directions for i in range(16)
+        ):
+            _CARDINAL_DIRECTIONS = tuple(cardinal_directions[i] for i in range(16))
+        else:
+            logger.warning("Cardinal directions are missing from the enums")
+            _CARDINAL_DIRECTIONS = None
+        _BEAUFORT_SCALE = beaufort_scale
+        _ENUM_MAPS = enum_maps
     if _UNIT_METADATA is None:
-        _UNIT_METADATA = load_units()
+        _UNIT_METADATA = _freeze(load_units())
     if _SENSORS_YAML is None:
-        _SENSORS_YAML = load_sensors()
+        # Sensor entries are frozen along with the key configuration
+        _SENSORS_YAML = MappingProxyType(load_sensors())
 
 
-def get_enum_maps() -> dict[str, dict[int, str]]:
+def get_enum_maps() -> Mapping[str, Mapping[int, str]]:
     """Get enum maps (lazy loaded)."""
-    _ensure_loaded()
     if _ENUM_MAPS is None:
-        raise RuntimeError("Enum maps failed to load")
+        _ensure_loaded()
+        if _ENUM_MAPS is None:
+            raise RuntimeError("Enum maps failed to load")
     return _ENUM_MAPS
 
 
-def _get_unit_metadata_dict() -> dict[str, dict[str, Any]]:
+def _get_unit_metadata_dict() -> Mapping[str, Mapping[str, Any]]:
     """Get unit metadata dictionary (lazy loaded)."""
-    _ensure_loaded()
     if _UNIT_METADATA is None:
-        raise RuntimeError("Unit metadata failed to load")
+        _ensure_loaded()
+        if _UNIT_METADATA is None:
+            raise RuntimeError("Unit metadata failed to load")
     return _UNIT_METADATA
 
 
-def get_sensors_yaml() -> dict[str, Any]:
+def get_sensors_yaml() -> Mapping[str, Any]:
     """Get sensors YAML configuration (lazy loaded)."""
-    _ensure_loaded()
     if _SENSORS_YAML is None:
-        raise RuntimeError("Sensors YAML failed to load")
+        _ensure_loaded()
+        if _SENSORS_YAML is None:
+            raise RuntimeError("Sensors YAML failed to load")
     return _SENSORS_YAML
 
 
+@lru_cache(maxsize=1024)
 def degrees_to_cardinal(degrees: float) -> str:
     """Convert wind direction in degrees to cardinal direction.
 
+    Results are cached, as stations report directions from a small set of
+    values.
+
     Parameters
     ----------
     degrees : float
@@ -72,9 +154,62 @@ def degrees_to_cardinal(degrees: float) -> str:
 
     """
     # Each direction covers 22.5 degrees (360/16)
-    # Add 11.25 to center the ranges, then divide by 22.5
-    index = int((degrees + 11.25) / 22.5) % 16
-    return get_enum_maps()["cardinal_directions"][index]
+    # Add 11.25 to center the ranges, then divide by 22.5; masking with 15 is
+    # the same as modulo 16, also for negative values
+    index = int((degrees + 11.25) * _CARDINAL_SECTOR_SCALE) & 15
+    if _CARDINAL_DIRECTIONS is None:
+        if _ENUM_MAPS is None:
+            _ensure_loaded()
+            return degrees_to_cardinal.__wrapped__(degrees)
+        # Without a complete table the direction is reported in degrees
+        return f"{degrees:g}°"
+    return _CARDINAL_DIRECTIONS[index]
+
+
+@lru_cache(maxsize=32)
+def timestamp_to_iso(timestamp: float) -> str:
+    """Convert a UTC epoch timestamp to an ISO 8601 string.
+
+    Results are cached as timestamps such as sunrise and sunset repeat in
+    every packet.
+
+    Parameters
+    ----------
+    timestamp : float
+        Seconds since the epoch
+
+    Returns
+    -------
+    str
+        ISO 8601 date and time in UTC (e.g., "2023-11-14T22:13:20+00:00")
+
+    """
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc).isoformat()
+
+
+def beaufort_to_string(force: float) -> str:
+    """Convert a Beaufort scale force to its description.
+
+    Parameters
+    ----------
+    force : float
+        Beaufort scale force (0-12)
+
+    Returns
+    -------
+    str
+        Description of the force (e.g., "3 - Gentle breeze")
+
+    """
+    level = int(force)
+    description = _BEAUFORT_SCALE.get(level)
+    if description is None:
+        if _ENUM_MAPS is None:
+            _ensure_loaded()
+            return beaufort_to_string(level)
+        # Only format the fallback for forces missing from the table
+        return f"{level} - Unknown"
+    return description
 
 
 class UnitSystem(str, Enum):
@@ -87,13 +222,15 @@ class UnitSystem(str, Enum):
     METRICWX = ("METRICWX", weewx.METRICWX)
     US = ("US", weewx.US)
 
+    # The WeeWX value is read from a slot rather than the instance dictionary
+    __slots__ = ("_weewx_value",)
+    _weewx_value: int
+
     def __new__(cls, value: str, weewx_value: int):
         """Create a new instance of the enumeration."""
         obj = str.__new__(cls, value)
         obj._value_ = value
-        obj.__dict__["_weewx_value"] = (
-            weewx_value  # Using __dict__ to set a protected attribute
-        )
+        obj._weewx_value = weewx_value
         return obj
 
     def __int__(self):
@@ -107,27 +244,44 @@ class UnitSystem(str, Enum):
     @classmethod
     def from_int(cls, value: int) -> "UnitSystem":
         """Get the unit system enumeration value from a WeeWX unit system value."""
-        for unit_system in cls:
-            if int(unit_system) == value:
-                return unit_system
-        raise ValueError(f"Invalid unit system value: {value}")
+        try:
+            return _UNIT_SYSTEMS_BY_INT[value]
+        except KeyError:
+            raise ValueError(f"Invalid unit system value: {value}") from None
 
 
-def get_unit_metadata(measurement_name: str, unit_system: UnitSystem) -> dict[str, Any]:
-    """Generate metadata for a measurement unit based on the unit system."""
-    (target_unit, target_group) = getStandardUnitType(
-        int(unit_system), measurement_name
-    )
+# Reverse lookup of unit systems by their WeeWX unit system value
+_UNIT_SYSTEMS_BY_INT: dict[int, UnitSystem] = {int(us): us for us in UnitSystem}
+
+
+@lru_cache(maxsize=512)
+def _std_unit_type(unit_system: int, measurement_name: str) -> tuple[Any, Any]:
+    """Return the WeeWX unit and unit group of a measurement in a unit system."""
+    return getStandardUnitType(unit_system, measurement_name)
+
+
+@lru_cache(maxsize=1024)
+def get_unit_metadata(
+    measurement_name: str, unit_system: UnitSystem
+) -> Mapping[str, Any]:
+    """Generate metadata for a measurement unit based on the unit system.
+
+    Results are cached and shared between callers as read-only mappings.
+    """
+    if measurement_name == "usUnits":
+        # Nothing to look up for usUnits, this is a special case
+        return _USUNITS_METADATA
+
+    unit_system_int = int(unit_system)
+    (target_unit, target_group) = _std_unit_type(unit_system_int, measurement_name)
 
     if target_unit is None:
         # take a guess at the unit based on the measurement name
-        if measurement_name == "usUnits":
-            pass  # Nothing to do for usUnits, this is a special case
-        elif measurement_name.endswith("ET"):
+        if measurement_name.endswith("ET"):
             # Map other evapotranspiration measurements (dayET, monthET, yearET) to the same unit as ET
-            (target_unit, _) = getStandardUnitType(int(unit_system), "ET")
+            (target_unit, _) = _std_unit_type(unit_system_int, "ET")
         elif measurement_name in {"sunrise", "sunset", "stormStart"}:
-            (target_unit, _) = getStandardUnitType(int(unit_system), "dateTime")
+            (target_unit, _) = _std_unit_type(unit_system_int, "dateTime")
         else:
             logger.warning(
                 "No unit found for measurement '%s' in unit system %s",
@@ -139,14 +293,44 @@ def get_unit_metadata(measurement_name: str, unit_system: UnitSystem) -> dict[st
                 "Guessed unit '%s' for measurement %s", target_unit, measurement_name
             )
 
-    return _get_unit_metadata_dict().get(
+    unit_metadata = _UNIT_METADATA
+    if unit_metadata is None:
+        unit_metadata = _get_unit_metadata_dict()
+    return unit_metadata.get(
         target_unit,
-        {"unit_of_measurement": target_unit},  # Defaults to the WeeWX unit if not found
+        # Defaults to the WeeWX unit if not found
+        MappingProxyType({"unit_of_measurement": target_unit}),
     )
 
 
-def get_key_config(weewx_key: str) -> dict[str, Any]:
-    """Generate metadata for a WeeWX key."""
+def _split_words(weewx_key: str) -> str:
+    """Split a camel case WeeWX key into title cased words.
+
+    Spaces are inserted before every run of digits and every upper case
+    letter, e.g., extraAlarm5 -> Extra Alarm 5.
+    """
+    chars: list[str] = []
+    previous_digit = False
+    for index, char in enumerate(weewx_key):
+        if char.isdecimal():
+            if not previous_digit:
+                chars.append(" ")
+            previous_digit = True
+        else:
+            previous_digit = False
+            if index and "A" <= char <= "Z":
+                chars.append(" ")
+        chars.append(char)
+    return "".join(chars).title()
+
+
+@lru_cache(maxsize=512)
+def get_key_config(weewx_key: str) -> Mapping[str, Any]:
+    """Generate metadata for a WeeWX key.
+
+    Results are cached and shared between callers as read-only mappings.
+    Copy the configuration before changing it.
+    """
     key_config_dict = get_key_config_dict()
 
     # First, attempt an exact match for the key
@@ -155,63 +339,125 @@ def get_key_config(weewx_key: str) -> dict[str, Any]:
         return config
 
     # Next, remove numeric suffix to check for a base key match
-    match = re.match(r"(.*?)(\d+)$", weewx_key)
-    if match:
-        base_key, suffix = match.groups()
+    base_key = weewx_key.rstrip(string.digits)
+    if base_key != weewx_key:
+        suffix = weewx_key.removeprefix(base_key)
         # If the base key is found in the known keys mapping, construct the friendly name
-        config = deepcopy(key_config_dict.get(base_key))
-        if config:
-            config["metadata"]["name"] = f"{config['metadata']['name']} {suffix}"
-            return config
+        base_config = key_config_dict.get(base_key)
+        if base_config:
+            # Only the metadata differs, everything else is shared with the base key
+            metadata = base_config["metadata"]
+            return _freeze_key_config(
+                {
+                    **base_config,
+                    "metadata": {**metadata, "name": f"{metadata['name']} {suffix}"},
+                }
+            )
 
     # If we still haven't found a match, generate a friendly name from the key
-    # Add space before digits (e.g., extraAlarm5 -> extraAlarm 5)
-    key_with_spaces = re.sub(r"(\d+)", r" \1", weewx_key)
-
-    # Split camel case (e.g., extraAlarm 5 -> Extra Alarm 5)
-    key_split = re.sub(r"(?<!^)(?=[A-Z])", " ", key_with_spaces).title()
+    key_split = _split_words(weewx_key)
 
     # Handle "in", "out", "tx", and "rx" prefixes for indoor, outdoor, transmit, and receive
-    if key_split.startswith("In "):
-        key_split = key_split.replace("In ", "Indoor ", 1)
-    elif key_split.startswith("Out "):
-        key_split = key_split.replace("Out ", "Outdoor ", 1)
-    elif key_split.startswith("Tx "):
-        key_split = key_split.replace("Tx ", "Transmit ", 1)
-    elif key_split.startswith("Rx "):
-        key_split = key_split.replace("Rx ", "Receive ", 1)
+    head, separator, tail = key_split.partition(" ")
+    if separator and (prefix := _NAME_PREFIXES.get(head)):
+        key_split = f"{prefix} {tail}"
 
     # Guess at what the metadata should be based on the key
-    guess: dict[str, Any] = {"metadata": {}}
-    if "alarm" in key_split.lower():
-        guess = deepcopy(key_config_dict["extraAlarm"])
-    elif "humidity" in key_split.lower():
-        guess = deepcopy(key_config_dict["outHumidity"])
-    elif "pressure" in key_split.lower():
-        guess = deepcopy(key_config_dict["pressure"])
-    elif "temperature" in key_split.lower():
-        guess = deepcopy(key_config_dict["outTemp"])
-
-    guess["metadata"]["name"] = key_split
-
-    logger.warning("Guessed metadata for key '%s': %s", weewx_key, guess)
+    template: Mapping[str, Any] = {"metadata": EMPTY_MAPPING}
+    key_lower = key_split.lower()
+    for keyword, template_key in _GUESS_TEMPLATES:
+        if keyword in key_lower:
+            template = key_config_dict[template_key]
+            break
+
+    guess = _freeze_key_config(
+        {**template, "metadata": {**template["metadata"], "name": key_split}}
+    )
+
+    logger.warning(
+        "Guessed metadata for key '%s': %s", weewx_key, dict(guess["metadata"])
+    )
     return guess
 
 
-# Lambda function registry for convert_lambda references in YAML
-_LAMBDA_REGISTRY = {
-    "beaufort_scale_map": lambda x, cp: get_enum_maps()["beaufort_scale"].get(
-        int(x), f"{int(x)} - Unknown"
-    ),
-    "degrees_to_cardinal": lambda x, cp: degrees_to_cardinal(x),
-    "localtime_to_utc_timestamp": lambda x, cp: datetime.fromtimestamp(
-        x, tz=timezone.utc
-    ).timestamp(),
-    "localtime_to_iso": lambda x, cp: datetime.fromtimestamp(
-        x, tz=timezone.utc
-    ).isoformat(),
-    "unit_system_to_string": lambda x, cp: str(UnitSystem.from_int(x)),
-}
+def reset_caches() -> None:
+    """Discard all loaded configuration and memoized key configurations.
+
+    Call after changing the language or configuration overrides so the
+    configuration is reloaded with the new settings on next use.
+    """
+    global _ENUM_MAPS, _UNIT_METADATA, _SENSORS_YAML
+    global _BEAUFORT_SCALE, _CARDINAL_DIRECTIONS, _KEY_CONFIG, _SOURCE_TO_DERIVED
+    _ENUM_MAPS = _UNIT_METADATA = _SENSORS_YAML = None
+    _BEAUFORT_SCALE = MappingProxyType({})
+    _CARDINAL_DIRECTIONS = None
+    _KEY_CONFIG = _SOURCE_TO_DERIVED = None
+    get_key_config.cache_clear()
+    _std_unit_type.cache_clear()
+    get_unit_metadata.cache_clear()
+    degrees_to_cardinal.cache_clear()
+
+
+# Conversion functions for convert_lambda references in YAML, called with the
+# value and the config publisher.  They are only reachable through the key
+# configuration, which is built after the enum tables are loaded.
+
+
+def _convert_beaufort_scale_map(x: Any, cp: Any) -> str:
+    """Convert a Beaufort force to its description."""
+    return beaufort_to_string(x)
+
+
+def _convert_degrees_to_cardinal(x: Any, cp: Any) -> str:
+    """Convert a direction in degrees to a cardinal direction."""
+    return degrees_to_cardinal(x)
+
+
+def _convert_localtime_to_utc_timestamp(x: Any, cp: Any) -> float:
+    """Convert a WeeWX timestamp, which is already UTC epoch seconds."""
+    return float(x)
+
+
+def _convert_localtime_to_iso(x: Any, cp: Any) -> str:
+    """Convert a WeeWX timestamp to an ISO 8601 string."""
+    return timestamp_to_iso(x)
+
+
+def _convert_unit_system_to_string(x: Any, cp: Any) -> str:
+    """Convert a WeeWX unit system value to its name."""
+    return str(UnitSystem.from_int(x))
+
+
+_LAMBDA_REGISTRY: Final[Mapping[str, Callable[[Any, Any], Any]]] = MappingProxyType(
+    {
+        "beaufort_scale_map": _convert_beaufort_scale_map,
+        "degrees_to_cardinal": _convert_degrees_to_cardinal,
+        "localtime_to_utc_timestamp": _convert_localtime_to_utc_timestamp,
+        "localtime_to_iso": _convert_localtime_to_iso,
+        "unit_system_to_string": _convert_unit_system_to_string,
+    }
+)
+
+
+def _freeze_key_config(config: Mapping[str, Any]) -> Mapping[str, Any]:
+    """Return a read-only view of a key configuration and its metadata.
+
+    Top-level and metadata string values are interned, as the same device
+    classes, icons and state classes are used by many sensors.
+    """
+    config = {
+        key: sys.intern(value) if type(value) is str else value
+        for key, value in config.items()
+    }
+    metadata = config.get("metadata")
+    if isinstance(metadata, Mapping):
+        config["metadata"] = MappingProxyType(
+            {
+                key: sys.intern(value) if type(value) is str else value
+                for key, value in metadata.items()
+            }
+        )
+    return MappingProxyType(config)
 
 
 def _build_key_config() -> dict[str, Any]:
@@ -223,11 +469,13 @@ def _build_key_config() -> dict[str, Any]:
         Complete KEY_CONFIG dictionary with lambda functions
 
     """
-    config = deepcopy(get_sensors_yaml())
-
-    for sensor_name, sensor_config in config.items():
+    # Sensor configurations are read-only views of the loaded YAML data; only
+    # the entries whose convert_lambda is resolved are shallow copies
+    config: dict[str, Any] = {}
+    for sensor_name, sensor_config in get_sensors_yaml().items():
         # Replace convert_lambda string references with actual lambda functions
         if "convert_lambda" in sensor_config:
+            sensor_config = dict(sensor_config)
             lambda_name = sensor_config["convert_lambda"]
             if lambda_name in _LAMBDA_REGISTRY:
                 sensor_config["convert_lambda"] = _LAMBDA_REGISTRY[lambda_name]
@@ -236,6 +484,7 @@ def _build_key_config() -> dict[str, Any]:
                     f"Unknown convert_lambda reference '{lambda_name}' for sensor '{sensor_name}'"
                 )
                 del sensor_config["convert_lambda"]
+        config[sensor_name] = _freeze_key_config(sensor_config)
 
     return config
 
@@ -250,3 +499,26 @@ def get_key_config_dict() -> dict[str, Any]:
     if _KEY_CONFIG is None:
         _KEY_CONFIG = _build_key_config()
     return _KEY_CONFIG
+
+
+# Global cache for the reverse index of derived sensors
+_SOURCE_TO_DERIVED: dict[str, list[str]] | None = None
+
+
+def get_source_to_derived_dict() -> dict[str, list[str]]:
+    """Get the mapping of source keys to derived sensor names (lazy loaded).
+
+    Returns
+    -------
+    dict[str, list[str]]
+        Dictionary mapping a WeeWX key to the sensors that derive from it
+
+    """
+    global _SOURCE_TO_DERIVED
+    if _SOURCE_TO_DERIVED is None:
+        source_to_derived: dict[str, list[str]] = defaultdict(list)
+        for sensor_name, sensor_config in get_key_config_dict().items():
+            if source := sensor_config.get("source"):
+                source_to_derived[source].append(sensor_name)
+        _SOURCE_TO_DERIVED = dict(source_to_derived)
+    return _SOURCE_TO_DERIVED
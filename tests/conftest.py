@@ -3,9 +3,16 @@
 https://docs.pytest.org/en/latest/writing_plugins.html#conftest-py-plugins
 """
 
+# Standard Python Libraries
+from typing import Any
+
 # Third-Party Libraries
 import pytest
 
+# Geekpad Libraries
+from weewx_ha import ConfigPublisher, StatePublisher, UnitSystem, locale_loader
+from weewx_ha.models import StationInfo
+
 
 def pytest_addoption(parser):
     """Add new commandline options to pytest."""
@@ -28,3 +35,48 @@ def pytest_collection_modifyitems(config, items):
     for item in items:
         if "slow" in item.keywords:
             item.add_marker(skip_slow)
+
+
+@pytest.fixture(autouse=True)
+def disk_cache_dir(tmp_path, monkeypatch):
+    """Keep parsed locale files out of the user's cache directory."""
+    monkeypatch.setattr(locale_loader, "_DISK_CACHE_DIR", tmp_path / "disk_cache")
+    return tmp_path / "disk_cache"
+
+
+class FakeMQTTClient:
+    """Record messages published by the code under test."""
+
+    def __init__(self):
+        """Initialize the list of published messages."""
+        self.published: list[tuple[str, Any]] = []
+
+    def publish(self, topic: str, payload: Any = None, *args, **kwargs) -> None:
+        """Record a published message."""
+        self.published.append((topic, payload))
+
+
+@pytest.fixture
+def mqtt_client():
+    """Return a fake MQTT client."""
+    return FakeMQTTClient()
+
+
+@pytest.fixture
+def config_publisher(mqtt_client):
+    """Return a configuration publisher using a fake MQTT client."""
+    return ConfigPublisher(
+        mqtt_client,
+        "weather/status",
+        "homeassistant",
+        "weather",
+        "station",
+        StationInfo(name="Station", model="Model", manufacturer="Maker"),
+        UnitSystem.METRICWX,
+    )
+
+
+@pytest.fixture
+def state_publisher(mqtt_client, config_publisher):
+    """Return a state publisher using a fake MQTT client."""
+    return StatePublisher(mqtt_client, config_publisher, "weather", UnitSystem.METRICWX)
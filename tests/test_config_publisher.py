@@ -0,0 +1,96 @@
+"""Test discovery configuration publishing."""
+
+# Standard Python Libraries
+import json
+
+# Geekpad Libraries
+from weewx_ha.locale_loader import set_config_overrides
+from weewx_ha.utils import reset_caches
+
+
+def test_publish_discovery(config_publisher, mqtt_client):
+    """Test that discovery configurations are published for seen measurements."""
+    packet = {"dateTime": 1700000000, "usUnits": 17, "outTemp": 20.0}
+    assert config_publisher.process_packet(packet) is True
+
+    config_publisher.publish_discovery()
+
+    messages = dict(mqtt_client.published)
+    topic = "homeassistant/sensor/station/outTemp/config"
+    assert topic in messages
+    payload = json.loads(messages[topic])
+    assert payload["state_topic"] == "weather/outTemp"
+    assert payload["unique_id"] == "station_outTemp"
+    assert payload["availability_topic"] == "weather/status"
+    assert payload["device"]["identifiers"] == ["station"]
+    assert None not in payload.values()
+
+
+def test_process_packet_no_new_measurements(config_publisher):
+    """Test that a repeated packet does not report new measurements."""
+    packet = {"dateTime": 1700000000, "usUnits": 17, "outTemp": 20.0}
+    assert config_publisher.process_packet(packet) is True
+    assert config_publisher.process_packet(packet) is False
+
+
+def test_derived_sensor_discovered(config_publisher, mqtt_client):
+    """Test that derived sensors are discovered along with their source."""
+    packet = {"dateTime": 1700000000, "usUnits": 17, "windDir": 90.0}
+    config_publisher.process_packet(packet)
+
+    assert "windDirCardinal" in config_publisher.seen_measurements
+
+    config_publisher.publish_discovery()
+
+    messages = dict(mqtt_client.published)
+    payload = json.loads(
+        messages["homeassistant/sensor/station/windDirCardinal/config"]
+    )
+    assert "unit_of_measurement" not in payload
+
+
+def test_nested_units_override_serialized(config_publisher, mqtt_client):
+    """Test that nested values of a units override are published as JSON."""
+    set_config_overrides({"units": {"degree_C": {"json_attributes": {"a": 1}}}})
+    reset_caches()
+    try:
+        packet = {"dateTime": 1700000000, "usUnits": 17, "outTemp": 20.0}
+        assert config_publisher.process_packet(packet) is True
+
+        config_publisher.publish_discovery()
+    finally:
+        set_config_overrides(None)
+        reset_caches()
+
+    messages = dict(mqtt_client.published)
+    payload = json.loads(messages["homeassistant/sensor/station/outTemp/config"])
+    assert payload["json_attributes"] == {"a": 1}
+
+
+def test_new_measurements_registered_in_packet_order(config_publisher):
+    """Test that new measurements are registered in the order of the packet."""
+    packet = {"dateTime": 1700000000, "usUnits": 17, "outTemp": 20.0, "barometer": 1}
+    config_publisher.process_packet(packet)
+
+    assert list(config_publisher.seen_measurements)[:4] == list(packet)
+
+
+def test_device_description_overrides_metadata(config_publisher, mqtt_client):
+    """Test that the station's device description takes precedence over metadata."""
+    set_config_overrides(
+        {"sensors": {"outTemp": {"metadata": {"device": {"name": "Other"}}}}}
+    )
+    reset_caches()
+    try:
+        packet = {"dateTime": 1700000000, "usUnits": 17, "outTemp": 20.0}
+        config_publisher.process_packet(packet)
+
+        config_publisher.publish_discovery()
+    finally:
+        set_config_overrides(None)
+        reset_caches()
+
+    messages = dict(mqtt_client.published)
+    payload = json.loads(messages["homeassistant/sensor/station/outTemp/config"])
+    assert payload["device"]["name"] == "Station"
+    assert payload["device"]["identifiers"] == ["station"]
@@ -1,17 +1,24 @@
 """Test locale configuration overrides functionality."""
 
 # Standard Python Libraries
+import marshal
+import os
 from typing import Any
 
 # Third-Party Libraries
 import pytest
 
 # Geekpad Libraries
+from weewx_ha import locale_loader
 from weewx_ha.locale_loader import (
+    _deep_merge,
+    _parse_yaml_file,
     get_config_overrides,
     load_enums,
     load_sensors,
     load_units,
+    load_yaml,
+    precompile_locales,
     set_config_overrides,
     set_language,
 )
@@ -213,3 +220,114 @@ def test_no_overrides(reset_locale_state):
     assert "outTemp" in sensors
     assert "degree_C" in units
     assert "cardinal_directions" in enums
+
+
+def test_overrides_invalidate_cached_data(reset_locale_state):
+    """Test that changing overrides is reflected by subsequent loads."""
+    assert load_sensors() is load_sensors()
+    original_name = load_sensors()["outTemp"]["metadata"]["name"]
+
+    set_config_overrides(
+        {"sensors": {"outTemp": {"metadata": {"name": "Changed Temperature"}}}}
+    )
+    assert load_sensors()["outTemp"]["metadata"]["name"] == "Changed Temperature"
+
+    set_config_overrides(None)
+    assert load_sensors()["outTemp"]["metadata"]["name"] == original_name
+
+
+def test_parsed_yaml_reused_until_file_changes(tmp_path, monkeypatch):
+    """Test that a parsed YAML file is reused until the file is modified."""
+    monkeypatch.setattr(locale_loader, "_DISK_CACHE_DIR", tmp_path / "cache")
+    path = tmp_path / "test.yaml"
+    path.write_text("key: value\n", encoding="utf-8")
+
+    data = _parse_yaml_file(path)
+    assert data == {"key": "value"}
+    assert _parse_yaml_file(path) is data
+
+    path.write_text("key: changed\n", encoding="utf-8")
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert _parse_yaml_file(path) == {"key": "changed"}
+
+
+def test_parsed_yaml_persisted_to_disk_cache(tmp_path, monkeypatch):
+    """Test that parsed YAML files are reused from the disk cache."""
+    monkeypatch.setattr(locale_loader, "_DISK_CACHE_DIR", tmp_path / "cache")
+    path = tmp_path / "test.yaml"
+    path.write_text("0: zero\n", encoding="utf-8")
+
+    assert _parse_yaml_file(path) == {0: "zero"}
+    assert list((tmp_path / "cache").iterdir())
+
+    # Forget the in-memory copy and make the YAML unparsable
+    locale_loader._YAML_CACHE.clear()
+    monkeypatch.setattr(locale_loader.yaml, "load", None)
+    assert _parse_yaml_file(path) == {0: "zero"}
+
+
+def test_malformed_disk_cache_ignored(tmp_path, monkeypatch):
+    """Test that disk cache files of an unexpected shape are not used."""
+    monkeypatch.setattr(locale_loader, "_DISK_CACHE_DIR", tmp_path / "cache")
+    path = tmp_path / "test.yaml"
+    path.write_text("key: value\n", encoding="utf-8")
+    cache_path = locale_loader._disk_cache_path(path)
+    cache_path.parent.mkdir()
+    cache_path.write_bytes(marshal.dumps(["not", "a", "tuple"]))
+
+    assert _parse_yaml_file(path) == {"key": "value"}
+
+
+def test_disk_cache_disabled_without_home(tmp_path, monkeypatch):
+    """Test that YAML files are still parsed when there is no home directory."""
+
+    def no_home():
+        raise RuntimeError("Could not determine home directory.")
+
+    monkeypatch.setattr(locale_loader, "_DISK_CACHE_DIR", None)
+    monkeypatch.delenv("XDG_CACHE_HOME", raising=False)
+    monkeypatch.setattr(locale_loader.Path, "home", no_home)
+    locale_loader._user_cache_dir.cache_clear()
+    path = tmp_path / "test.yaml"
+    path.write_text("key: value\n", encoding="utf-8")
+
+    try:
+        assert locale_loader._disk_cache_path(path) is None
+        assert _parse_yaml_file(path) == {"key": "value"}
+    finally:
+        locale_loader._user_cache_dir.cache_clear()
+
+
+def test_enum_references_resolved_without_copying(reset_locale_state):
+    """Test that only sensors containing enum references are rebuilt."""
+    sensors = load_sensors()
+    raw = load_yaml("sensors.yaml")
+
+    options = sensors["windDirCardinal"]["metadata"]["options"]
+    assert options[0] == "N"
+    assert raw["windDirCardinal"]["metadata"]["options"] == "@cardinal_directions"
+    assert sensors["outTemp"] is raw["outTemp"]
+
+
+def test_precompile_locales(tmp_path, monkeypatch):
+    """Test that all bundled locale files are written to the disk cache."""
+    monkeypatch.setattr(locale_loader, "_DISK_CACHE_DIR", tmp_path)
+    locale_loader._YAML_CACHE.clear()
+
+    count = precompile_locales()
+
+    assert count == len(list(locale_loader._LOCALES_DIR.glob("*.yaml")))
+    assert len(list(tmp_path.iterdir())) == count
+
+
+def test_deep_merge_shares_unchanged_dictionaries():
+    """Test that merging only copies the dictionaries along merged paths."""
+    base = {"a": {"x": 1}, "b": {"y": 2}}
+
+    merged = _deep_merge(base, {"a": {"x": 3}, "b": {}})
+
+    assert merged == {"a": {"x": 3}, "b": {"y": 2}}
+    assert merged["b"] is base["b"]
+    assert base == {"a": {"x": 1}, "b": {"y": 2}}
+    assert _deep_merge(base, {}) is base
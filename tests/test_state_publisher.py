@@ -0,0 +1,38 @@
+"""Test state publishing."""
+
+# Geekpad Libraries
+from weewx_ha import StatePublisher, UnitSystem
+
+
+def test_publish_state_and_derived(config_publisher, state_publisher, mqtt_client):
+    """Test that states of measurements and their derived sensors are published."""
+    packet = {"dateTime": 1700000000, "usUnits": 17, "windDir": 90.0}
+    config_publisher.process_packet(packet)
+
+    state_publisher.process_packet(packet)
+
+    messages = dict(mqtt_client.published)
+    assert messages["weather/windDir"] == 90.0
+    assert messages["weather/windDirCardinal"] == "E"
+
+
+def test_skip_unknown_and_none_values(state_publisher, mqtt_client):
+    """Test that unknown measurements and None values are not published."""
+    state_publisher.process_packet({"usUnits": 17, "outTemp": None, "unknown": 1})
+
+    assert mqtt_client.published == []
+
+
+def test_publish_state_to_own_prefix(config_publisher, mqtt_client):
+    """Test that states are published below the state publisher's own prefix."""
+    state_publisher = StatePublisher(
+        mqtt_client, config_publisher, "state", UnitSystem.METRICWX
+    )
+    packet = {"dateTime": 1700000000, "usUnits": 17, "windDir": 90.0}
+    config_publisher.process_packet(packet)
+
+    state_publisher.process_packet(packet)
+
+    messages = dict(mqtt_client.published)
+    assert messages["state/windDir"] == 90.0
+    assert messages["state/windDirCardinal"] == "E"
@@ -0,0 +1,135 @@
+"""Test utility functions."""
+
+# Third-Party Libraries
+import pytest
+
+# Geekpad Libraries
+from weewx_ha import utils
+from weewx_ha.locale_loader import set_language
+from weewx_ha.utils import (
+    UnitSystem,
+    beaufort_to_string,
+    degrees_to_cardinal,
+    get_key_config,
+    get_unit_metadata,
+    reset_caches,
+    timestamp_to_iso,
+)
+
+
+@pytest.mark.parametrize(
+    "weewx_key,name,device_class",
+    [
+        ("outTemp", "Outdoor Temperature", "temperature"),
+        ("extraTemp3", "Extra Temperature 3", "temperature"),
+        ("extraHumid7", "Extra Humidity 7", "humidity"),
+        ("inFooBar2", "Indoor Foo Bar 2", None),
+        ("outFoo", "Outdoor Foo", None),
+        ("txSignal", "Transmit Signal", None),
+        ("myPressureThing", "My Pressure Thing", "atmospheric_pressure"),
+        ("soilTemperatureX", "Soil Temperature X", "temperature"),
+        ("weirdKey", "Weird Key", None),
+    ],
+)
+def test_get_key_config(weewx_key, name, device_class):
+    """Test that configurations are found or guessed for WeeWX keys."""
+    metadata = get_key_config(weewx_key)["metadata"]
+    assert metadata["name"] == name
+    assert metadata.get("device_class") == device_class
+
+
+def test_get_key_config_numeric_suffix_keeps_template():
+    """Test that numbered keys do not change the configuration they are based on."""
+    base_name = get_key_config("extraTemp")["metadata"]["name"]
+    get_key_config("extraTemp4")
+    assert get_key_config("extraTemp")["metadata"]["name"] == base_name
+
+
+def test_get_key_config_guess_keeps_template():
+    """Test that guessed keys do not change the configuration they are based on."""
+    base_name = get_key_config("pressure")["metadata"]["name"]
+    get_key_config("otherPressureValue")
+    assert get_key_config("pressure")["metadata"]["name"] == base_name
+
+
+@pytest.mark.parametrize(
+    "force,description",
+    [(0, "0 - Calm"), (3.0, "3 - Gentle breeze"), (13, "13 - Unknown")],
+)
+def test_beaufort_to_string(force, description):
+    """Test that Beaufort forces are converted to their descriptions."""
+    assert beaufort_to_string(force) == description
+
+
+def test_reset_caches_reloads_language():
+    """Test that key configurations follow a language change after a reset."""
+    english_name = get_key_config("outTemp")["metadata"]["name"]
+    try:
+        set_language("cs")
+        reset_caches()
+        assert get_key_config("outTemp")["metadata"]["name"] != english_name
+    finally:
+        set_language(None)
+        reset_caches()
+    assert get_key_config("outTemp")["metadata"]["name"] == english_name
+
+
+@pytest.mark.parametrize(
+    "degrees,direction",
+    [(0, "N"), (11.24, "N"), (11.25, "NNE"), (90, "E"), (348.75, "N"), (360, "N")],
+)
+def test_degrees_to_cardinal(degrees, direction):
+    """Test that wind directions are converted to cardinal directions."""
+    assert degrees_to_cardinal(degrees) == direction
+
+
+def test_timestamp_to_iso():
+    """Test that timestamps are converted to ISO 8601 strings in UTC."""
+    assert timestamp_to_iso(1700000000) == "2023-11-14T22:13:20+00:00"
+
+
+def test_missing_enums_fall_back(monkeypatch):
+    """Test that key configurations and conversions work without the enums."""
+    monkeypatch.setattr(utils, "load_enums", dict)
+    reset_caches()
+    try:
+        assert get_key_config("outTemp")["metadata"]["name"]
+        assert degrees_to_cardinal(90) == "90°"
+        assert degrees_to_cardinal(180) == "180°"
+        assert beaufort_to_string(3) == "3 - Unknown"
+    finally:
+        monkeypatch.undo()
+        reset_caches()
+    assert degrees_to_cardinal(90) == "E"
+
+
+def test_get_key_config_read_only():
+    """Test that shared key configurations cannot be modified."""
+    config = get_key_config("outTemp")
+    with pytest.raises(TypeError):
+        config["metadata"]["name"] = "Changed"  # type: ignore[index]
+
+
+@pytest.mark.parametrize(
+    "measurement_name,unit_of_measurement",
+    [("outTemp", "°C"), ("dayET", "mm"), ("usUnits", None)],
+)
+def test_get_unit_metadata(measurement_name, unit_of_measurement):
+    """Test that unit metadata is found for measurements."""
+    metadata = get_unit_metadata(measurement_name, UnitSystem.METRICWX)
+    assert metadata["unit_of_measurement"] == unit_of_measurement
+
+
+def test_get_key_config_numeric_suffix_shares_conversion():
+    """Test that numbered keys share the conversion of their base key."""
+    base_config = get_key_config("dateTime")
+    config = get_key_config("dateTime2")
+    assert config["convert_lambda"] is base_config["convert_lambda"]
+    assert config["metadata"]["name"] == f"{base_config['metadata']['name']} 2"
+
+
+def test_unit_metadata_shares_value_templates():
+    """Test that units with the same rounding share one value template."""
+    celsius = get_unit_metadata("outTemp", UnitSystem.METRICWX)
+    fahrenheit = get_unit_metadata("outTemp", UnitSystem.US)
+    assert celsius["value_template"] is fahrenheit["value_template"]